@@ -1,3 +1,153 @@
+import os
+
+import pandas as pd
 import streamlit as st
 
-st.write("hello, world")
\ No newline at end of file
+from jsonl_loader import load_json_lines_fast
+
+TITANIC_PATH = "./data/titanic.csv"
+REVIEWS_PATH = "./data/All_Beauty_5.json"
+EMBEDDED_PATH = "./data/All_Beauty_5_embedded.json"
+
+# 리뷰 데이터에서 실제로 쓰는 필드만 로드
+REVIEW_FIELDS = [
+    "overall", "vote", "verified", "reviewerID", "asin",
+    "style", "reviewerName", "reviewText", "summary", "unixReviewTime",
+]
+
+# 고유값이 이 개수 이하인 문자열 컬럼은 카테고리로 취급
+MAX_CATEGORIES = 50
+
+# 카테고리 필터에서 결측값(NaN)을 고르는 옵션
+MISSING = "(missing)"
+
+st.set_page_config(page_title="Dataset Explorer", layout="wide")
+
+
+# 반복되는 문자열 컬럼은 category로 바꿔서 메모리/필터 비용 절감
+def _compact(df):
+    for col in df.select_dtypes(include="object").columns:
+        if df[col].nunique(dropna=True) <= MAX_CATEGORIES:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _reviews_frame(items):
+    df = pd.DataFrame.from_records(items)
+    # style dict → style_Size, style_Flavor 같은 개별 컬럼으로 펼치기
+    if "style" in df.columns:
+        style = pd.json_normalize(df.pop("style").apply(lambda s: s if isinstance(s, dict) else {}))
+        style.columns = ["style_" + c.rstrip(":").strip() for c in style.columns]
+        for col in style.columns:
+            df[col] = style[col].str.strip()
+    if "vote" in df.columns:
+        df["vote"] = pd.to_numeric(df["vote"].astype(str).str.replace(",", ""), errors="coerce")
+    if "unixReviewTime" in df.columns:
+        df["reviewDate"] = pd.to_datetime(df.pop("unixReviewTime"), unit="s")
+    return _compact(df)
+
+
+# mtime을 캐시 키에 포함 → 파일이 바뀔 때만 다시 파싱
+@st.cache_data(show_spinner="Loading titanic.csv...")
+def load_titanic(path, mtime):
+    return _compact(pd.read_csv(path))
+
+
+@st.cache_data(show_spinner="Loading reviews...")
+def load_reviews(path, mtime):
+    items, _ = load_json_lines_fast(path, fields=REVIEW_FIELDS)
+    return _reviews_frame(items)
+
+
+@st.cache_data(show_spinner="Loading embeddings...")
+def load_embedded(path, mtime):
+    # 벡터는 표에 보여주지 않으므로 파싱 결과에서 제외
+    items, _ = load_json_lines_fast(path, fields=["id"] + REVIEW_FIELDS)
+    return _reviews_frame(items)
+
+
+DATASETS = {
+    "Titanic": (TITANIC_PATH, load_titanic),
+    "All Beauty reviews": (REVIEWS_PATH, load_reviews),
+    "All Beauty embeddings": (EMBEDDED_PATH, load_embedded),
+}
+
+
+# 사이드바 위젯 값으로 불리언 마스크를 만들어 한 번에 필터링
+def apply_filters(df, key):
+    mask = pd.Series(True, index=df.index)
+    columns = st.sidebar.multiselect("Filter columns", list(df.columns), key=f"{key}:columns")
+    for col in columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype):
+            options = series.dropna().unique().tolist()
+            if series.isna().any():
+                options.append(MISSING)
+            chosen = st.sidebar.multiselect(col, options, default=options, key=f"{key}:{col}")
+            mask &= series.isin(chosen) | (series.isna() & (MISSING in chosen))
+        elif pd.api.types.is_numeric_dtype(series):
+            if series.notna().sum() == 0 or series.min() == series.max():
+                continue
+            lo, hi = float(series.min()), float(series.max())
+            start, end = st.sidebar.slider(col, lo, hi, (lo, hi), key=f"{key}:{col}")
+            mask &= series.between(start, end) | (series.isna() & (start == lo) & (end == hi))
+        elif pd.api.types.is_datetime64_any_dtype(series):
+            if series.notna().sum() == 0 or series.min() == series.max():
+                continue
+            lo, hi = series.min().date(), series.max().date()
+            selected = st.sidebar.date_input(col, (lo, hi), min_value=lo, max_value=hi, key=f"{key}:{col}")
+            # 범위 선택 중(날짜 하나만 고른 상태)에는 필터 적용 안 함
+            if len(selected) == 2:
+                start, end = pd.Timestamp(selected[0]), pd.Timestamp(selected[1]) + pd.Timedelta(days=1)
+                mask &= (series >= start) & (series < end)
+        else:
+            text = st.sidebar.text_input(f"{col} contains", key=f"{key}:{col}")
+            if text:
+                mask &= series.astype(str).str.contains(text, case=False, regex=False, na=False)
+    return df[mask]
+
+
+def show_aggregation(df):
+    group_options = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)
+                     or pd.api.types.is_bool_dtype(df[c])]
+    value_options = df.select_dtypes(include="number").columns.tolist()
+    if not group_options or not value_options:
+        return
+
+    with st.expander("Aggregate"):
+        col1, col2, col3 = st.columns(3)
+        group_by = col1.selectbox("Group by", group_options)
+        value = col2.selectbox("Value", value_options)
+        func = col3.selectbox("Function", ["mean", "sum", "count", "min", "max", "median"])
+        result = df.groupby(group_by, observed=True)[value].agg(func).rename(f"{func}({value})")
+        st.dataframe(result.reset_index(), use_container_width=True)
+        st.bar_chart(result)
+
+
+# 현재 페이지 행만 잘라서 렌더링
+def show_page(df):
+    col1, col2 = st.columns([1, 3])
+    page_size = col1.selectbox("Rows per page", [25, 50, 100, 250], index=1)
+    n_pages = max(1, -(-len(df) // page_size))
+    page = col2.number_input(f"Page (1-{n_pages})", min_value=1, max_value=n_pages, value=1)
+    start = (page - 1) * page_size
+    st.dataframe(df.iloc[start:start + page_size], use_container_width=True)
+    st.caption(f"Rows {start + 1 if len(df) else 0}-{min(start + page_size, len(df))} of {len(df):,}")
+
+
+st.title("Dataset Explorer")
+
+available = {name: spec for name, spec in DATASETS.items() if os.path.exists(spec[0])}
+if not available:
+    st.error("No datasets found under ./data")
+    st.stop()
+
+name = st.sidebar.selectbox("Dataset", list(available))
+path, loader = available[name]
+df = loader(path, os.path.getmtime(path))
+
+filtered = apply_filters(df, name)
+st.metric("Rows", f"{len(filtered):,}", delta=f"{len(filtered) - len(df):,}" if len(filtered) != len(df) else None)
+
+show_aggregation(filtered)
+show_page(filtered)
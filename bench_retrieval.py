@@ -0,0 +1,125 @@
+import argparse
+import os
+import random
+import time
+from collections import defaultdict
+
+from dotenv import load_dotenv
+
+from hybrid_search import BM25Index, HybridRetriever, document_text
+
+EMBEDDED_PATH = "./data/All_Beauty_5_embedded.json"
+BM25_PATH = "./data/All_Beauty_5_bm25.json"
+
+
+# 평가용 질의 생성: style(사이즈/향) + 요약 → 같은 asin + style의 "다른" 리뷰를 정답으로 사용
+# (질의를 만든 원본 리뷰는 정답에서 빼고, 다른 리뷰가 없는 그룹은 건너뜀)
+def build_queries(docs, n_queries, seed):
+    groups = defaultdict(set)
+    for doc_id, doc in docs.items():
+        style = tuple(sorted((doc.get("style") or {}).items()))
+        groups[(doc.get("asin"), style)].add(doc_id)
+
+    candidates = [doc_id for doc_id, doc in docs.items() if doc.get("style")]
+    random.Random(seed).shuffle(candidates)
+
+    queries = []
+    for doc_id in candidates:
+        if len(queries) >= n_queries:
+            break
+        doc = docs[doc_id]
+        style = tuple(sorted(doc["style"].items()))
+        relevant = groups[(doc.get("asin"), style)] - {doc_id}
+        if not relevant:
+            continue
+        style_text = " ".join(v.strip() for v in doc["style"].values())
+        queries.append({
+            "source_id": doc_id,
+            "text": f"{doc.get('summary', '')} {style_text}".strip(),
+            "relevant": relevant,
+        })
+    return queries
+
+
+# 질의 임베딩: Azure OpenAI 설정이 있어야 함 (저장된 리뷰 임베딩을 쓰면 정답이 새어 나감)
+def make_query_embedder():
+    load_dotenv()
+    api_key = os.getenv("OPENAI_API_KEY")
+    endpoint = os.getenv("OPENAI_ENDPOINT")
+    deployment = os.getenv("EMBEDDING_DEPLOYMENT_NAME")
+
+    if api_key and endpoint and deployment:
+        from openai import AzureOpenAI
+        client = AzureOpenAI(api_version="2024-12-01-preview", azure_endpoint=endpoint, api_key=api_key)
+        print(f"🔧 Query embeddings: Azure OpenAI ({deployment})")
+        return lambda query: client.embeddings.create(input=query["text"], model=deployment).data[0].embedding
+
+    return None
+
+
+# 원본 리뷰는 정답이 아니므로 순위에서 빼고 top-k를 평가
+def recall_at_k(ranking, query, k):
+    top = [doc_id for doc_id, _ in ranking if doc_id != query["source_id"]][:k]
+    hits = sum(1 for doc_id in top if doc_id in query["relevant"])
+    return hits / min(len(query["relevant"]), k)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BM25 / vector / hybrid(RRF) retrieval benchmark")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--candidates", type=int, default=50)
+    parser.add_argument("--rrf-k", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"📂 Loading {EMBEDDED_PATH}...")
+    start = time.perf_counter()
+    retriever = HybridRetriever.from_files(EMBEDDED_PATH, BM25_PATH)
+    print(f"✅ Loaded {len(retriever.docs)} documents in {time.perf_counter() - start:.2f}s")
+
+    # 색인 생성 시간 측정
+    start = time.perf_counter()
+    index = BM25Index()
+    for doc_id, doc in retriever.docs.items():
+        index.add(doc_id, document_text(doc))
+    print(f"📊 BM25 build: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    queries = build_queries(retriever.docs, args.queries, args.seed)
+    if not queries:
+        print("❌ No asin + style group has more than one review. Nothing to evaluate.")
+        return
+
+    modes = {
+        "bm25": lambda q, v: retriever.bm25.search(q["text"], args.candidates),
+    }
+    embed = make_query_embedder()
+    if embed is None:
+        query_vectors = [None] * len(queries)
+        print("⚠️ No embedding credentials — skipping vector and hybrid modes")
+    else:
+        query_vectors = [embed(query) for query in queries]
+        modes["vector"] = lambda q, v: retriever.vectors.search(v, args.candidates)
+        # rag-app.py와 같은 경로(HybridRetriever.rank)로 측정
+        modes["hybrid"] = lambda q, v: retriever.rank(
+            q["text"], v, k=args.candidates, candidates=args.candidates, rrf_k=args.rrf_k,
+        )
+
+    print(f"\n🔍 {len(queries)} queries, recall@{args.k}")
+    print(f"{'mode':<8} {'recall':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, search in modes.items():
+        latencies = []
+        recalls = []
+        for query, vector in zip(queries, query_vectors):
+            start = time.perf_counter()
+            ranking = search(query, vector)
+            latencies.append((time.perf_counter() - start) * 1000)
+            recalls.append(recall_at_k(ranking, query, args.k))
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2]
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f"{name:<8} {sum(recalls) / len(recalls):>8.3f} {p50:>8.2f} {p95:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@ import os
 from dotenv import load_dotenv
 from openai import AzureOpenAI  # 최신 SDK 사용
 from tqdm import tqdm
+from jsonl_loader import load_json_lines_fast, PARSER_NAME
+from hybrid_search import BM25Index, document_text
 
 # 1️⃣ .env 로드 + OpenAI 설정
 print("📦 Loading .env...")
@@ -38,13 +40,22 @@ DEPLOYMENT_ID = deployment_id
 # 2️⃣ 파일 경로
 INPUT_PATH = "./data/All_Beauty_5.json"
 OUTPUT_PATH = "./data/All_Beauty_5_embedded.json"
+BM25_PATH = "./data/All_Beauty_5_bm25.json"
 
 print(f"\n📂 File paths:")
 print(f"Input: {INPUT_PATH}")
 print(f"Output: {OUTPUT_PATH}")
+print(f"BM25 index: {BM25_PATH}")
 
-# 3️⃣ 파일 읽기 (디버깅 추가)
-def load_json_lines(filepath):
+# 3️⃣ 파일 읽기 (청크 단위 고속 파싱 + 필요한 필드만 선택)
+# 임베딩 결과를 쓰는 곳(rag-app.py 검색, app.py 탐색기)에서 필요한 필드만 유지
+# (reviewTime은 unixReviewTime과 중복, image는 사용하지 않음)
+INPUT_FIELDS = [
+    "overall", "vote", "verified", "reviewerID", "asin",
+    "style", "reviewerName", "reviewText", "summary", "unixReviewTime",
+]
+
+def load_json_lines(filepath, fields=None, workers=None):
     print(f"\n🔍 Loading JSON lines from: {filepath}")
     
     # 파일 존재 확인
@@ -56,34 +67,20 @@ def load_json_lines(filepath):
     file_size = os.path.getsize(filepath)
     print(f"📊 File size: {file_size:,} bytes")
     
-    data = []
     try:
-        with open(filepath, "r", encoding='utf-8') as f:
-            print("📖 Reading file line by line...")
-            for line_num, line in enumerate(f):
-                try:
-                    line = line.strip()
-                    if not line:  # 빈 줄 스킵
-                        continue
-                    
-                    item = json.loads(line)
-                    data.append(item)
-                    
-                    # 첫 3개 아이템 샘플 출력
-                    if line_num < 3:
-                        print(f"  Sample {line_num}: {str(item)[:100]}...")
-                    
-                except json.JSONDecodeError as e:
-                    print(f"❌ JSON decode error at line {line_num}: {e}")
-                    continue
-                except Exception as e:
-                    print(f"❌ Unexpected error at line {line_num}: {e}")
-                    continue
-    
+        print(f"📖 Reading file in chunks (parser: {PARSER_NAME})...")
+        data, errors = load_json_lines_fast(filepath, fields=fields, workers=workers)
     except Exception as e:
         print(f"❌ Error reading file: {e}")
         return []
     
+    if errors:
+        print(f"❌ Skipped {errors} invalid lines (JSON decode error or non-object)")
+    
+    # 첫 3개 아이템 샘플 출력
+    for i, item in enumerate(data[:3]):
+        print(f"  Sample {i}: {str(item)[:100]}...")
+    
     print(f"✅ Successfully loaded {len(data)} items")
     return data
 
@@ -143,7 +140,7 @@ if __name__ == "__main__":
     print("STEP 1: Loading input data")
     print("="*50)
     
-    data = load_json_lines(INPUT_PATH)
+    data = load_json_lines(INPUT_PATH, fields=INPUT_FIELDS)
     
     if not data:
         print("❌ No data loaded. Exiting.")
@@ -159,6 +156,7 @@ if __name__ == "__main__":
             print(f"  {key}: {str(value)[:50]}{'...' if len(str(value)) > 50 else ''}")
     
     enriched = []
+    bm25 = BM25Index()  # 임베딩과 함께 BM25 색인도 생성
     
     print("\n" + "="*50)
     print("STEP 2: Processing embeddings")
@@ -189,6 +187,7 @@ if __name__ == "__main__":
             item["id"] = str(i)
             item["embedding"] = vector
             enriched.append(item)
+            bm25.add(item["id"], document_text(item))
             
             print(f"[{i}] ✅ Success — vector length: {len(vector)}")
             
@@ -209,6 +208,8 @@ if __name__ == "__main__":
     
     if enriched:
         save_json_lines(OUTPUT_PATH, enriched)
+        bm25.save(BM25_PATH)
+        print(f"✅ BM25 index saved: {len(bm25)} documents → {BM25_PATH}")
         print(f"✅ Done! Total embedded: {len(enriched)}/{len(data)}")
         print(f"📊 Success rate: {len(enriched)/len(data)*100:.1f}%")
     else:
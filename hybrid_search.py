@@ -0,0 +1,177 @@
+import json
+import math
+import os
+import re
+from collections import Counter, defaultdict
+
+import numpy as np
+
+from jsonl_loader import load_json_lines_fast
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:\.[0-9]+)?")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+# 검색 대상 텍스트: 리뷰 본문 + 요약 + style(사이즈/향 등)
+def document_text(item):
+    parts = [item.get("reviewText", ""), item.get("summary", "")]
+    style = item.get("style") or {}
+    parts.extend(str(value) for value in style.values())
+    return " ".join(part for part in parts if part)
+
+
+class BM25Index:
+    """문서를 하나씩 추가할 수 있는 로컬 BM25 역색인"""
+
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = defaultdict(dict)  # term -> {doc_id: tf}
+        self.doc_len = {}
+        self.doc_terms = {}  # doc_id -> [term] (삭제 시 해당 posting만 수정)
+        self.total_len = 0
+
+    def __len__(self):
+        return len(self.doc_len)
+
+    def add(self, doc_id, text):
+        if doc_id in self.doc_len:
+            self.remove(doc_id)
+        counts = Counter(tokenize(text))
+        for term, tf in counts.items():
+            self.postings[term][doc_id] = tf
+        self.doc_terms[doc_id] = list(counts)
+        length = sum(counts.values())
+        self.doc_len[doc_id] = length
+        self.total_len += length
+
+    def remove(self, doc_id):
+        length = self.doc_len.pop(doc_id, None)
+        if length is None:
+            return
+        self.total_len -= length
+        for term in self.doc_terms.pop(doc_id, []):
+            docs = self.postings[term]
+            docs.pop(doc_id, None)
+            if not docs:
+                del self.postings[term]
+
+    def search(self, query, k=10):
+        n_docs = len(self.doc_len)
+        if n_docs == 0:
+            return []
+        avg_len = self.total_len / n_docs
+        scores = defaultdict(float)
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc_id, tf in docs.items():
+                norm = self.k1 * (1 - self.b + self.b * self.doc_len[doc_id] / avg_len)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return sorted(scores.items(), key=lambda pair: pair[1], reverse=True)[:k]
+
+    def save(self, filepath):
+        dirname = os.path.dirname(filepath)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump({
+                "k1": self.k1,
+                "b": self.b,
+                "doc_len": self.doc_len,
+                "postings": self.postings,
+            }, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, filepath):
+        with open(filepath, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        index = cls(raw["k1"], raw["b"])
+        index.doc_len = raw["doc_len"]
+        index.total_len = sum(index.doc_len.values())
+        index.postings = defaultdict(dict, raw["postings"])
+        index.doc_terms = defaultdict(list)
+        for term, docs in index.postings.items():
+            for doc_id in docs:
+                index.doc_terms[doc_id].append(term)
+        index.doc_terms = dict(index.doc_terms)
+        return index
+
+
+class VectorIndex:
+    """임베딩 코사인 유사도 brute-force top-k"""
+
+    def __init__(self, ids, vectors):
+        self.ids = list(ids)
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if not self.ids:
+            self.matrix = matrix.reshape(0, 0)
+            return
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self.matrix = matrix / np.where(norms == 0, 1, norms)
+
+    def search(self, query_vector, k=10):
+        if not self.ids:
+            return []
+        query = np.asarray(query_vector, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1)
+        scores = self.matrix @ query
+        k = min(k, len(self.ids))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.ids[i], float(scores[i])) for i in top]
+
+
+def reciprocal_rank_fusion(rankings, k=60, top_k=10):
+    """여러 랭킹 [(doc_id, score), ...]을 RRF로 합침: score = Σ 1 / (k + rank)"""
+    fused = defaultdict(float)
+    for ranking in rankings:
+        for rank, (doc_id, _) in enumerate(ranking, start=1):
+            fused[doc_id] += 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda pair: pair[1], reverse=True)[:top_k]
+
+
+class HybridRetriever:
+    """BM25 + 벡터 검색 결과를 RRF로 합치는 로컬 검색기"""
+
+    def __init__(self, docs, bm25, vectors):
+        self.docs = docs
+        self.bm25 = bm25
+        self.vectors = vectors
+
+    @classmethod
+    def from_files(cls, embedded_path, bm25_path=None):
+        items, _ = load_json_lines_fast(embedded_path)
+        items = [item for item in items if "embedding" in item]
+        ids = [item["id"] for item in items]
+        vectors = VectorIndex(ids, [item.pop("embedding") for item in items])
+        docs = dict(zip(ids, items))
+
+        # 저장된 BM25 색인이 없거나 임베딩 파일보다 오래됐으면 새로 생성
+        if (bm25_path and os.path.exists(bm25_path)
+                and os.path.getmtime(bm25_path) >= os.path.getmtime(embedded_path)):
+            bm25 = BM25Index.load(bm25_path)
+        else:
+            bm25 = BM25Index()
+            for doc_id, item in docs.items():
+                bm25.add(doc_id, document_text(item))
+            if bm25_path:
+                bm25.save(bm25_path)
+        return cls(docs, bm25, vectors)
+
+    def rank(self, query, query_vector, k=5, candidates=50, rrf_k=60):
+        """RRF로 합친 [(doc_id, score), ...] 반환"""
+        # 색인에만 있고 임베딩 파일에는 없는 문서는 합치기 전에 제외
+        lexical = [(doc_id, score) for doc_id, score in self.bm25.search(query, candidates)
+                   if doc_id in self.docs]
+        semantic = self.vectors.search(query_vector, candidates)
+        return reciprocal_rank_fusion([lexical, semantic], k=rrf_k, top_k=k)
+
+    def search(self, query, query_vector, k=5, candidates=50, rrf_k=60):
+        fused = self.rank(query, query_vector, k=k, candidates=candidates, rrf_k=rrf_k)
+        return [self.docs[doc_id] for doc_id, _ in fused]
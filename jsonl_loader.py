@@ -0,0 +1,102 @@
+import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# orjson이 설치되어 있으면 사용 (없으면 표준 json으로 대체)
+try:
+    import orjson
+    _loads = orjson.loads
+    PARSER_NAME = "orjson"
+except ImportError:
+    _loads = json.loads
+    PARSER_NAME = "json"
+
+# 청크 크기 / 멀티프로세스 사용 기준
+CHUNK_SIZE = 64 * 1024 * 1024          # 64MB
+PARALLEL_THRESHOLD = 256 * 1024 * 1024  # 256MB 이상이면 프로세스 분산
+
+
+# 청크 경계를 줄바꿈 위치에 맞춰 계산
+def _chunk_ranges(mm, file_size, chunk_size):
+    ranges = []
+    start = 0
+    while start < file_size:
+        end = min(start + chunk_size, file_size)
+        if end < file_size:
+            newline = mm.find(b"\n", end)
+            end = file_size if newline == -1 else newline + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+# 청크 하나 파싱 → (items, 에러 개수)
+# 줄마다 따로 파싱해야 잘린 줄/여러 값이 든 줄이 다른 레코드와 합쳐지지 않음
+def _parse_chunk(buf, fields):
+    items = []
+    errors = 0
+    for line in buf.split(b"\n"):
+        if not line.strip():
+            continue
+        try:
+            item = _loads(line)
+        except ValueError:
+            errors += 1
+            continue
+        if fields is not None:
+            # 필드 선택은 객체(dict)에만 가능 → 그 외 값은 에러로 집계
+            if not isinstance(item, dict):
+                errors += 1
+                continue
+            item = {key: item[key] for key in fields if key in item}
+        items.append(item)
+    return items, errors
+
+
+# 워커 프로세스용: 파일을 직접 열어 자기 구간만 읽음
+def _parse_range(args):
+    filepath, start, end, fields = args
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        buf = f.read(end - start)
+    return _parse_chunk(buf, fields)
+
+
+def iter_json_chunks(filepath, fields=None, workers=None, chunk_size=CHUNK_SIZE):
+    """JSONL 파일을 청크 단위로 파싱해서 (items, errors)를 순서대로 반환.
+
+    fields를 주면 해당 키만 남기고, workers가 2 이상이거나 파일이
+    PARALLEL_THRESHOLD보다 크면 여러 프로세스로 나눠서 파싱한다.
+    """
+    file_size = os.path.getsize(filepath)
+    if file_size == 0:
+        return
+
+    with open(filepath, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = _chunk_ranges(mm, file_size, chunk_size)
+
+            if workers is None:
+                workers = os.cpu_count() if file_size >= PARALLEL_THRESHOLD else 1
+            workers = max(1, min(workers, len(ranges)))
+
+            if workers == 1:
+                for start, end in ranges:
+                    yield _parse_chunk(mm[start:end], fields)
+                return
+
+    tasks = [(filepath, start, end, fields) for start, end in ranges]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(_parse_range, tasks):
+            yield result
+
+
+def load_json_lines_fast(filepath, fields=None, workers=None, chunk_size=CHUNK_SIZE):
+    """JSONL 파일 전체를 리스트로 로드. 반환값: (data, 에러 줄 개수)"""
+    data = []
+    errors = 0
+    for items, chunk_errors in iter_json_chunks(filepath, fields, workers, chunk_size):
+        data.extend(items)
+        errors += chunk_errors
+    return data, errors
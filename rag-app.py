@@ -1,6 +1,22 @@
 import os
 from dotenv import load_dotenv
 from openai import AzureOpenAI
+from hybrid_search import HybridRetriever
+
+EMBEDDED_PATH = "./data/All_Beauty_5_embedded.json"
+BM25_PATH = "./data/All_Beauty_5_bm25.json"
+RETRIEVAL_MODES = ("vector", "hybrid")
+
+# 로컬 하이브리드 검색 결과를 프롬프트용 컨텍스트로 변환
+def build_context(docs):
+    lines = []
+    for doc in docs:
+        style = ", ".join(f"{k.rstrip(':')}: {v.strip()}" for k, v in (doc.get("style") or {}).items())
+        lines.append(
+            f"[doc {doc['id']}] asin={doc.get('asin')} rating={doc.get('overall')} {style}\n"
+            f"{doc.get('summary', '')}: {doc.get('reviewText', '')}"
+        )
+    return "Answer using only the following reviews:\n\n" + "\n\n".join(lines)
 
 def main():
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -15,6 +31,12 @@ def main():
     search_endpoint = os.getenv("SEARCH_ENDPOINT")
     search_api_key = os.getenv("SEARCH_API_KEY")
     search_index_name = os.getenv("SEARCH_INDEX_NAME")
+    # "vector": Azure AI Search 벡터 검색, "hybrid": 로컬 BM25 + 벡터 RRF
+    retrieval_mode = os.getenv("RAG_RETRIEVAL_MODE", "vector")
+    if retrieval_mode not in RETRIEVAL_MODES:
+        print(f"Invalid RAG_RETRIEVAL_MODE: {retrieval_mode!r} (expected one of: {', '.join(RETRIEVAL_MODES)})")
+        exit(1)
+    top_k = int(os.getenv("RAG_TOP_K", "5"))
 
     # Initialize Azure OpenAI client
     chat_client = AzureOpenAI(
@@ -23,6 +45,12 @@ def main():
         api_key=openai_api_key
     )
 
+    retriever = None
+    if retrieval_mode == "hybrid":
+        print("Loading local hybrid index...")
+        retriever = HybridRetriever.from_files(EMBEDDED_PATH, BM25_PATH)
+        print(f"Loaded {len(retriever.docs)} documents.")
+
     # Initialize prompt with system message
     prompt = [
         {
@@ -42,36 +70,51 @@ def main():
 
         prompt.append({"role": "user", "content": input_text})
 
-        # Additional parameters to apply RAG pattern using the AI Search index
-        rag_params = {
-            "data_sources": [
-                {
-                    # The following params are used to search the index
-                    "type": "azure_search",
-                    "parameters": {
-                        "endpoint": search_endpoint,
-                        "index_name": search_index_name,
-                        "authentication": {
-                            "type": "api_key",
-                            "key": search_api_key,
-                        },
-                        # The following params are used to vectorize the query
-                        "query_type": "vector",
-                        "embedding_dependency": {
-                            "type": "deployment_name",
-                            "deployment_name": embedding_deployment_name,
-                        },
+        if retriever is not None:
+            # 질문 임베딩 → BM25 + 벡터 top-k를 RRF로 합쳐서 컨텍스트 구성
+            query_vector = chat_client.embeddings.create(
+                input=input_text,
+                model=embedding_deployment_name
+            ).data[0].embedding
+            docs = retriever.search(input_text, query_vector, k=top_k)
+            context = {"role": "system", "content": build_context(docs)}
+
+            # submit the prompt to the chat client
+            response = chat_client.chat.completions.create(
+                model=chat_deployment_name,
+                messages=prompt[:-1] + [context, prompt[-1]],
+            )
+        else:
+            # Additional parameters to apply RAG pattern using the AI Search index
+            rag_params = {
+                "data_sources": [
+                    {
+                        # The following params are used to search the index
+                        "type": "azure_search",
+                        "parameters": {
+                            "endpoint": search_endpoint,
+                            "index_name": search_index_name,
+                            "authentication": {
+                                "type": "api_key",
+                                "key": search_api_key,
+                            },
+                            # The following params are used to vectorize the query
+                            "query_type": "vector",
+                            "embedding_dependency": {
+                                "type": "deployment_name",
+                                "deployment_name": embedding_deployment_name,
+                            },
+                        }
                     }
-                }
-            ],
-        }
+                ],
+            }
 
-        # submit the prompt to the chat client
-        response = chat_client.chat.completions.create(
-            model=chat_deployment_name,
-            messages=prompt,
-            extra_body=rag_params,
-        )
+            # submit the prompt to the chat client
+            response = chat_client.chat.completions.create(
+                model=chat_deployment_name,
+                messages=prompt,
+                extra_body=rag_params,
+            )
 
         completion = response.choices[0].message.content
         print(f"AI Response: {completion}")
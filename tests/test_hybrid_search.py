@@ -0,0 +1,123 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hybrid_search import BM25Index, HybridRetriever, VectorIndex, reciprocal_rank_fusion
+
+DOCS = [
+    {"id": "0", "reviewText": "Smells like fresh ocean breeze", "summary": "Great scent",
+     "style": {"Size:": " 7.0 oz", "Flavor:": " Classic Ice Blue"}, "embedding": [1.0, 0.0, 0.0]},
+    {"id": "1", "reviewText": "Too strong, smells like perfume", "summary": "Not for me",
+     "style": {"Size:": " 3.4 oz"}, "embedding": [0.0, 1.0, 0.0]},
+    {"id": "2", "reviewText": "Nice shampoo for dry hair", "summary": "Good value",
+     "embedding": [0.0, 0.0, 1.0]},
+]
+
+
+class BM25IndexTest(unittest.TestCase):
+    def assert_consistent(self, index):
+        self.assertEqual(index.total_len, sum(index.doc_len.values()))
+        self.assertTrue(all(index.postings.values()))
+        self.assertEqual(set(index.doc_terms), set(index.doc_len))
+
+    def test_add_remove_readd(self):
+        index = BM25Index()
+        index.add("a", "ice blue ice")
+        index.add("b", "blue ocean")
+        self.assert_consistent(index)
+
+        index.remove("a")
+        self.assert_consistent(index)
+        self.assertNotIn("ice", index.postings)
+        self.assertEqual(dict(index.postings["blue"]), {"b": 1})
+
+        index.add("b", "shampoo")
+        self.assert_consistent(index)
+        self.assertNotIn("blue", index.postings)
+        self.assertEqual(len(index), 1)
+
+        index.remove("missing")
+        self.assert_consistent(index)
+
+    def test_save_load_round_trip(self):
+        index = BM25Index()
+        for doc in DOCS:
+            index.add(doc["id"], doc["reviewText"])
+        path = os.path.join(tempfile.mkdtemp(), "bm25.json")
+        index.save(path)
+        loaded = BM25Index.load(path)
+
+        for query in ["smells like", "dry hair", "perfume ocean", "unknown"]:
+            self.assertEqual(loaded.search(query, 10), index.search(query, 10))
+        loaded.remove("0")
+        self.assert_consistent(loaded)
+
+    def test_save_bare_filename(self):
+        cwd = os.getcwd()
+        os.chdir(tempfile.mkdtemp())
+        self.addCleanup(os.chdir, cwd)
+        BM25Index().save("bm25.json")
+        self.assertTrue(os.path.exists("bm25.json"))
+
+
+class ReciprocalRankFusionTest(unittest.TestCase):
+    def test_order(self):
+        lexical = [("a", 9.0), ("b", 5.0), ("c", 1.0)]
+        semantic = [("c", 0.9), ("a", 0.8), ("d", 0.1)]
+        fused = reciprocal_rank_fusion([lexical, semantic], k=60, top_k=10)
+        self.assertEqual([doc_id for doc_id, _ in fused], ["a", "c", "b", "d"])
+        self.assertAlmostEqual(fused[0][1], 1 / 61 + 1 / 62)
+        self.assertEqual(len(reciprocal_rank_fusion([lexical, semantic], top_k=2)), 2)
+
+
+class VectorIndexTest(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(VectorIndex([], []).search([1.0, 0.0], 5), [])
+
+
+class HybridRetrieverTest(unittest.TestCase):
+    def write_files(self, bm25_docs):
+        directory = tempfile.mkdtemp()
+        embedded_path = os.path.join(directory, "embedded.json")
+        bm25_path = os.path.join(directory, "bm25.json")
+        with open(embedded_path, "w", encoding="utf-8") as f:
+            for doc in DOCS:
+                f.write(json.dumps(doc) + "\n")
+        index = BM25Index()
+        for doc_id, text in bm25_docs.items():
+            index.add(doc_id, text)
+        index.save(bm25_path)
+        return embedded_path, bm25_path
+
+    def test_search_drops_ids_missing_from_docs(self):
+        embedded_path, bm25_path = self.write_files({"0": "ocean", "99": "smells smells smells"})
+        os.utime(bm25_path, (os.path.getmtime(embedded_path) + 10,) * 2)
+        retriever = HybridRetriever.from_files(embedded_path, bm25_path)
+        self.assertIn("99", retriever.bm25.doc_len)
+
+        ranked = retriever.rank("smells", [0.0, 1.0, 0.0], k=5)
+        self.assertNotIn("99", [doc_id for doc_id, _ in ranked])
+        results = retriever.search("smells", [0.0, 1.0, 0.0], k=5)
+        self.assertEqual([doc["id"] for doc in results], [doc_id for doc_id, _ in ranked])
+
+    def test_from_files_rebuilds_and_saves_stale_index(self):
+        embedded_path, bm25_path = self.write_files({"99": "orphan"})
+        os.utime(bm25_path, (os.path.getmtime(embedded_path) - 10,) * 2)
+        retriever = HybridRetriever.from_files(embedded_path, bm25_path)
+        self.assertEqual(set(retriever.bm25.doc_len), {"0", "1", "2"})
+        self.assertEqual(set(BM25Index.load(bm25_path).doc_len), {"0", "1", "2"})
+
+    def test_from_files_without_embeddings(self):
+        embedded_path, bm25_path = self.write_files({})
+        with open(embedded_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"id": "0", "reviewText": "no vector"}) + "\n")
+        retriever = HybridRetriever.from_files(embedded_path, bm25_path)
+        self.assertEqual(retriever.search("vector", [1.0, 0.0, 0.0]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from jsonl_loader import load_json_lines_fast
+
+
+class LoadJsonLinesFastTest(unittest.TestCase):
+    def load(self, text, **kwargs):
+        fd, path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        self.addCleanup(os.remove, path)
+        return load_json_lines_fast(path, **kwargs)
+
+    def test_matches_line_by_line_json(self):
+        lines = [{"a": i, "b": "x" * i} for i in range(50)]
+        text = "\n".join(json.dumps(line) for line in lines) + "\n\n"
+        self.assertEqual(self.load(text, chunk_size=64), (lines, 0))
+        self.assertEqual(self.load(text, chunk_size=64, workers=2), (lines, 0))
+
+    def test_broken_line_is_skipped(self):
+        self.assertEqual(self.load('{"a": 1}\nbad\n{"a": 2}'), ([{"a": 1}, {"a": 2}], 1))
+
+    def test_split_record_is_not_stitched(self):
+        self.assertEqual(self.load('{"a": 1\n"b": 2}\n'), ([], 2))
+        self.assertEqual(self.load('{"a":[1\n2]}\n'), ([], 2))
+
+    def test_multi_value_line_is_an_error(self):
+        self.assertEqual(self.load('{"a":1}, {"b":2}\n{"c":3}\n'), ([{"c": 3}], 1))
+
+    def test_projection(self):
+        text = '{"a": 1, "b": 2, "c": 3}\n'
+        self.assertEqual(self.load(text, fields=["a", "c", "z"]), ([{"a": 1, "c": 3}], 0))
+
+    def test_projection_counts_non_objects_as_errors(self):
+        text = '5\n[1, 2]\n{"a": 1, "b": 2}\n'
+        self.assertEqual(self.load(text, fields=["a"]), ([{"a": 1}], 2))
+        self.assertEqual(self.load(text), ([5, [1, 2], {"a": 1, "b": 2}], 0))
+
+
+if __name__ == "__main__":
+    unittest.main()